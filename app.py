@@ -1,14 +1,29 @@
 import streamlit as st
+import io
 import os
 import tempfile
 import subprocess
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Set
+from urllib.parse import quote, urlsplit
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import requests
 import zipfile
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page configuration
 st.set_page_config(
@@ -17,8 +32,177 @@ st.set_page_config(
     layout="wide"
 )
 
-def clone_gitlab_repo(repo_url: str, temp_dir: str) -> bool:
-    """Clone GitLab repository to temporary directory using multiple methods"""
+# I18n patterns grouped by category and pattern type
+_I18N_PATTERNS = {
+    'gettext': {
+        'imports': [r'import\s+gettext', r'from\s+gettext\s+import'],
+        'functions': [r'_\(', r'gettext\(', r'ngettext\('],
+        'setup': [r'gettext\..\(.\)', r'\.bindtextdomain\(', r'\.textdomain\(']
+    },
+    'streamlit_i18n': {
+        'imports': [r'import\s+streamlit_i18n', r'from\s+streamlit_i18n'],
+        'functions': [r'i18n\(', r'\.translate\(', r'\.t\(']
+    },
+    'babel': {
+        'imports': [r'import\s+babel', r'from\s+babel'],
+        'functions': [r'Locale\(', r'format_currency\(', r'format_date\(']
+    },
+    'custom_translation': {
+        'dictionaries': [r'translations\s*=\s*{', r'languages\s*=\s*{', r'TRANSLATIONS\s*='],
+        'functions': [r'translate\(', r'get_text\(', r'tr\(']
+    },
+    'language_detection': {
+        'patterns': [r'st\.selectbox.*lang', r'language.*select', r'locale', r'LANG']
+    }
+}
+
+# All i18n patterns fused into one alternation so each file is scanned once.
+# Group names encode "<category>__<pattern_type>__<index>".
+_I18N_FUSED_RE = re.compile(
+    '|'.join(
+        f'(?P<{category}__{pattern_type}__{i}>{pattern})'
+        for category, pattern_dict in _I18N_PATTERNS.items()
+        for pattern_type, pattern_list in pattern_dict.items()
+        for i, pattern in enumerate(pattern_list)
+    ),
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Directories never searched for Streamlit sources: caches, virtualenvs,
+# vendored packages and build output
+_SKIP_DIRS = frozenset({
+    '__pycache__', 'node_modules', 'venv', '.venv', 'site-packages', 'dist',
+    'build', '.tox', '.mypy_cache', '.pytest_cache', '.git', '.idea', '.vscode'
+})
+
+# Larger .py files are almost always generated or minified, not app code
+_MAX_SOURCE_FILE_BYTES = 1_048_576
+
+# Imports, st. calls and translation tables sit near the top of real-world
+# modules, so only this much of each file is probed and analyzed by default
+MAX_SCAN_BYTES = 65536
+
+# Markers of a Streamlit source file, searched in the raw bytes of its head
+_STREAMLIT_PROBE_RE = re.compile(rb'(?i:streamlit)|st\.')
+
+# Worker threads for per-file analysis; reads overlap with regex scanning
+_ANALYSIS_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Classifies translation files by extension; .json/.yaml files only count when
+# their name carries a translation keyword
+_TRANSLATION_FILE_RE = re.compile(
+    r'\.(po|mo|properties)$|(?i:lang|translation|locale|i18n).*\.(json|ya?ml)$'
+)
+_TRANSLATION_BUCKETS = {
+    'po': 'po_files',
+    'mo': 'mo_files',
+    'properties': 'properties_files',
+    'json': 'json_translations',
+    'yml': 'yaml_translations',
+    'yaml': 'yaml_translations'
+}
+
+# Packages whose presence in requirements files signals i18n support
+_I18N_PACKAGES = [
+    'streamlit-i18n', 'babel', 'gettext', 'python-gettext',
+    'flask-babel', 'django-rosetta', 'polib', 'translate'
+]
+
+# Finds every package name in one case-insensitive pass. The lookahead makes
+# matches zero-width, so a name nested in a longer one ('gettext' inside
+# 'python-gettext') is still found, as with separate substring checks.
+_I18N_PACKAGE_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(package) for package in _I18N_PACKAGES) + '))',
+    re.IGNORECASE
+)
+
+# Language detection focused on English and Indic languages
+_LANGUAGE_INDICATORS = {
+    'english': ['en', 'english', 'hello', 'thank you', 'please', 'welcome', 'goodbye'],
+    'hindi': ['hi', 'हिंदी', 'नमस्ते', 'धन्यवाद', 'कृपया', 'स्वागत', 'अलविदा'],
+    'bengali': ['bn', 'বাংলা', 'নমস্কার', 'ধন্যবাদ', 'দয়া করে', 'স্বাগতম'],
+    'tamil': ['ta', 'தமிழ்', 'வணக்கம்', 'நன்றி', 'தயவுசெய்து', 'வரவேற்கிறோம்'],
+    'telugu': ['te', 'తెలుగు', 'నమస్కారం', 'ధన్యవాదాలు', 'దయచేసి', 'స్వాగతం'],
+    'marathi': ['mr', 'मराठी', 'नमस्कार', 'धन्यवाद', 'कृपया', 'स्वागत'],
+    'gujarati': ['gu', 'ગુજરાતી', 'નમસ્તે', 'આભાર', 'કૃપા કરીને', 'સ્વાગત'],
+    'kannada': ['kn', 'ಕನ್ನಡ', 'ನಮಸ್ತೆ', 'ಧನ್ಯವಾದಗಳು', 'ದಯವಿಟ್ಟು', 'ಸ್ವಾಗತ'],
+    'malayalam': ['ml', 'മലയാളം', 'നമസ്തേ', 'നന്ദി', 'ദയവായി', 'സ്വാഗതം'],
+    'punjabi': ['pa', 'ਪੰਜਾਬੀ', 'ਸਤ ਸ੍ਰੀ ਅਕਾਲ', 'ਧੰਨਵਾਦ', 'ਕਿਰਪਾ ਕਰਕੇ'],
+    'oriya': ['or', 'ଓଡ଼ିଆ', 'ନମସ୍କାର', 'ଧନ୍ୟବାଦ', 'ଦୟାକରି', 'ସ୍ୱାଗତ'],
+    'assamese': ['as', 'অসমীয়া', 'নমস্কাৰ', 'ধন্যবাদ', 'অনুগ্ৰহ কৰি'],
+    'urdu': ['ur', 'اردو', 'آداب', 'شکریہ', 'براہ کرم', 'خوش آمدید'],
+    'sanskrit': ['sa', 'संस्कृत', 'नमस्ते', 'धन्यवाद', 'कृपया'],
+    'kashmiri': ['ks', 'कॉशुर', 'नमस्कार', 'शुक्रिया', 'मेहरबानी'],
+    'nepali': ['ne', 'नेपाली', 'नमस्ते', 'धन्यवाद', 'कृपया', 'स्वागत'],
+    'sinhala': ['si', 'සිංහල', 'ආයුබෝවන්', 'ස්තූතියි', 'කරුණාකර']
+}
+
+# ASCII indicators are matched case-insensitively, one pattern per language,
+# so content never needs a lowercased copy and each search stops at its first hit
+_ASCII_INDICATOR_RES = {
+    lang: re.compile('|'.join(re.escape(i) for i in indicators if i.isascii()), re.IGNORECASE)
+    for lang, indicators in _LANGUAGE_INDICATORS.items()
+    if any(i.isascii() for i in indicators)
+}
+
+# Indic and Urdu scripts are caseless, so these indicators match raw content
+_UNICODE_INDICATORS = {
+    lang: [i for i in indicators if not i.isascii()]
+    for lang, indicators in _LANGUAGE_INDICATORS.items()
+}
+
+def _build_indicator_automaton():
+    """Build an Aho-Corasick automaton mapping each Unicode indicator to the languages it signals"""
+    indicator_languages = {}
+    for lang, indicators in _UNICODE_INDICATORS.items():
+        for indicator in indicators:
+            indicator_languages.setdefault(indicator, set()).add(lang)
+    
+    automaton = ahocorasick.Automaton()
+    for indicator, languages in indicator_languages.items():
+        automaton.add_word(indicator, frozenset(languages))
+    automaton.make_automaton()
+    return automaton
+
+# Single-pass multi-pattern matcher over all Unicode language indicators
+if ahocorasick is not None:
+    _UNICODE_INDICATOR_AUTOMATON = _build_indicator_automaton()
+
+def _probe_archive_url(url: str):
+    """Send a HEAD request to an archive URL, returning the response or the raised error"""
+    try:
+        return requests.head(url, timeout=5, allow_redirects=True)
+    except Exception as e:
+        return e
+
+def _find_archive_urls(possible_urls: List[str]) -> List[str]:
+    """Probe archive URLs concurrently with HEAD requests and return those answering 200
+    
+    The result keeps the order of possible_urls, so preferred branches come first.
+    """
+    with ThreadPoolExecutor(max_workers=len(possible_urls)) as executor:
+        probes = list(executor.map(_probe_archive_url, possible_urls))
+    
+    available_urls = []
+    for i, (url, probe) in enumerate(zip(possible_urls, probes)):
+        if isinstance(probe, Exception):
+            st.warning(f"Method {i+1} failed: {str(probe)}")
+        elif probe.status_code == 200:
+            available_urls.append(url)
+        elif probe.status_code == 404:
+            st.warning(f"Repository not found or branch doesn't exist for method {i+1}")
+        elif probe.status_code == 403:
+            st.warning(f"Access denied - repository might be private (method {i+1})")
+        else:
+            st.warning(f"HTTP {probe.status_code} for method {i+1}")
+    
+    return available_urls
+
+def clone_gitlab_repo(repo_url: str, temp_dir: str) -> Optional[str]:
+    """Clone GitLab repository to temporary directory using multiple methods
+    
+    Returns the directory holding the repository's files, or None on failure.
+    """
     try:
         # Method 1: Try git clone first
         if not repo_url.endswith('.git'):
@@ -27,14 +211,24 @@ def clone_gitlab_repo(repo_url: str, temp_dir: str) -> bool:
             git_url = repo_url
         
         try:
+            # Shallow, blobless clone: only the current tree is needed for analysis
             result = subprocess.run(
-                ['git', 'clone', git_url, temp_dir],
+                ['git', 'clone', '--depth=1', '--single-branch', '--no-tags',
+                 '--filter=blob:none', git_url, temp_dir],
                 capture_output=True,
                 text=True,
                 timeout=60
             )
+            if result.returncode != 0 and 'filter' in result.stderr:
+                # Server refused the partial clone; fall back to a plain clone
+                result = subprocess.run(
+                    ['git', 'clone', git_url, temp_dir],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
             if result.returncode == 0:
-                return True
+                return temp_dir
             else:
                 st.info(f"Git clone failed: {result.stderr}")
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
@@ -63,118 +257,103 @@ def clone_gitlab_repo(repo_url: str, temp_dir: str) -> bool:
                         f"{protocol_and_domain}/{owner}/{repo}/repository/archive.zip?ref=master"
                     ]
                     
-                    for i, zip_url in enumerate(possible_urls):
+                    # Probe all candidates at once, then download the available ones
+                    # in order of preference until one extracts
+                    for zip_url in _find_archive_urls(possible_urls):
                         try:
-                            st.info(f"Trying download method {i+1}/4: {zip_url}")
-                            response = requests.get(zip_url, timeout=30)
-                            st.info(f"Response status: {response.status_code}")
-                            
-                            if response.status_code == 200:
-                                zip_path = os.path.join(temp_dir, 'repo.zip')
-                                with open(zip_path, 'wb') as f:
-                                    f.write(response.content)
+                            st.info(f"Downloading archive: {zip_url}")
+                            with requests.get(zip_url, stream=True, timeout=30) as response:
+                                response.raise_for_status()
+                                
+                                # Stream the archive into memory; ZipFile needs a seekable
+                                # file, but there is no need for a copy on disk
+                                response.raw.decode_content = True
+                                archive = io.BytesIO()
+                                shutil.copyfileobj(response.raw, archive)
+                                archive.seek(0)
                                 
-                                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                                    zip_ref.extractall(temp_dir)
+                                extract_dir = os.path.join(temp_dir, '_extract')
+                                shutil.rmtree(extract_dir, ignore_errors=True)
+                                with zipfile.ZipFile(archive) as zip_ref:
+                                    zip_ref.extractall(extract_dir)
                                 
-                                # Move extracted content to temp_dir root
-                                extracted_dirs = [d for d in os.listdir(temp_dir) if os.path.isdir(os.path.join(temp_dir, d))]
-                                if extracted_dirs:
-                                    extracted_path = os.path.join(temp_dir, extracted_dirs[0])
-                                    for item in os.listdir(extracted_path):
-                                        shutil.move(os.path.join(extracted_path, item), temp_dir)
-                                    os.rmdir(extracted_path)
+                                # Rename the archive's top-level directory into place
+                                # in one step instead of moving its items one by one
+                                repo_dir = os.path.join(temp_dir, 'repo')
+                                extracted = os.listdir(extract_dir)
+                                if len(extracted) == 1 and os.path.isdir(os.path.join(extract_dir, extracted[0])):
+                                    os.rename(os.path.join(extract_dir, extracted[0]), repo_dir)
+                                else:
+                                    os.rename(extract_dir, repo_dir)
                                 
-                                os.remove(zip_path)
-                                return True
-                            elif response.status_code == 404:
-                                st.warning(f"Repository not found or branch doesn't exist for method {i+1}")
-                            elif response.status_code == 403:
-                                st.warning(f"Access denied - repository might be private (method {i+1})")
-                            else:
-                                st.warning(f"HTTP {response.status_code} for method {i+1}")
+                                return repo_dir
                         except Exception as e:
-                            st.warning(f"Method {i+1} failed: {str(e)}")
+                            st.warning(f"Archive download failed: {str(e)}")
                             continue
         except Exception as e:
             st.error(f"URL parsing error: {str(e)}")
         
-        return False
+        return None
         
     except Exception as e:
         st.error(f"Error accessing repository: {str(e)}")
-        return False
+        return None
 
-def find_streamlit_files(directory: str) -> List[Path]:
-    """Find all Python files that might be Streamlit applications"""
-    streamlit_files = []
+def _scan_python_files(directory: str, full_scan: bool = False) -> Iterator[str]:
+    """Yield paths of .py files under directory, skipping hidden and non-source directories
     
-    for root, dirs, files in os.walk(directory):
-        # Skip hidden directories and common non-source directories
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['_pycache_', 'node_modules']]
-        
-        for file in files:
-            if file.endswith('.py'):
-                file_path = Path(root) / file
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        if 'streamlit' in content.lower() or 'st.' in content:
-                            streamlit_files.append(file_path)
-                except Exception:
-                    continue
-    
-    return streamlit_files
-
-def analyze_i18n_patterns(file_path: Path) -> Dict:
-    """Analyze a file for internationalization patterns"""
-    patterns = {
-        'gettext': {
-            'imports': [r'import\s+gettext', r'from\s+gettext\s+import'],
-            'functions': [r'_\(', r'gettext\(', r'ngettext\('],
-            'setup': [r'gettext\..\(.\)', r'\.bindtextdomain\(', r'\.textdomain\(']
-        },
-        'streamlit_i18n': {
-            'imports': [r'import\s+streamlit_i18n', r'from\s+streamlit_i18n'],
-            'functions': [r'i18n\(', r'\.translate\(', r'\.t\(']
-        },
-        'babel': {
-            'imports': [r'import\s+babel', r'from\s+babel'],
-            'functions': [r'Locale\(', r'format_currency\(', r'format_date\(']
-        },
-        'custom_translation': {
-            'dictionaries': [r'translations\s*=\s*{', r'languages\s*=\s*{', r'TRANSLATIONS\s*='],
-            'functions': [r'translate\(', r'get_text\(', r'tr\(']
-        },
-        'language_detection': {
-            'patterns': [r'st\.selectbox.*lang', r'language.*select', r'locale', r'LANG']
-        }
-    }
+    Files over _MAX_SOURCE_FILE_BYTES are skipped unless full_scan is set.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.') and entry.name not in _SKIP_DIRS:
+                        yield from _scan_python_files(entry.path, full_scan)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    try:
+                        if not full_scan and entry.stat().st_size > _MAX_SOURCE_FILE_BYTES:
+                            continue
+                    except OSError:
+                        continue
+                    yield entry.path
+    except OSError:
+        return
+
+def _read_streamlit_source(file_path: str, full_scan: bool = False) -> Optional[str]:
+    """Return the decoded source of a file if it looks like a Streamlit application
     
+    Only the first MAX_SCAN_BYTES are returned unless full_scan is set.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            data = f.read(MAX_SCAN_BYTES)
+            if not _STREAMLIT_PROBE_RE.search(data):
+                return None
+            if full_scan:
+                data += f.read()
     except Exception:
-        return {}
+        return None
+    return data.decode('utf-8', errors='ignore')
+
+def analyze_i18n_patterns(file_path: str, content: Optional[str] = None) -> Dict:
+    """Analyze a file for internationalization patterns, reading it only if content is not given"""
+    if content is None:
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read(MAX_SCAN_BYTES)
+        except Exception:
+            return {}
     
     results = {}
     
-    for category, pattern_dict in patterns.items():
-        category_results = {}
-        for pattern_type, pattern_list in pattern_dict.items():
-            matches = []
-            for pattern in pattern_list:
-                found = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-                if found:
-                    matches.extend(found)
-            if matches:
-                category_results[pattern_type] = matches
-        if category_results:
-            results[category] = category_results
+    for match in _I18N_FUSED_RE.finditer(content):
+        category, pattern_type, _ = match.lastgroup.split('__')
+        results.setdefault(category, {}).setdefault(pattern_type, []).append(match.group())
     
     return results
 
-def find_translation_files(directory: str) -> Dict[str, List[Path]]:
+def find_translation_files(directory: str) -> Dict[str, List[str]]:
     """Find translation-related files"""
     translation_files = {
         'po_files': [],
@@ -184,64 +363,43 @@ def find_translation_files(directory: str) -> Dict[str, List[Path]]:
         'properties_files': []
     }
     
-    for root, dirs, files in os.walk(directory):
+    # os.fwalk recurses via directory fds (openat/fstatat) where available;
+    # os.walk yields no fd, so pad its entries to the same shape
+    if hasattr(os, 'fwalk'):
+        walker = os.fwalk(directory)
+    else:
+        walker = ((root, dirs, files, None) for root, dirs, files in os.walk(directory))
+    
+    for root, dirs, files, _ in walker:
         dirs[:] = [d for d in dirs if not d.startswith('.')]
         
         for file in files:
-            file_path = Path(root) / file
-            
-            if file.endswith('.po'):
-                translation_files['po_files'].append(file_path)
-            elif file.endswith('.mo'):
-                translation_files['mo_files'].append(file_path)
-            elif file.endswith('.json') and any(keyword in file.lower() for keyword in ['lang', 'translation', 'locale', 'i18n']):
-                translation_files['json_translations'].append(file_path)
-            elif file.endswith(('.yml', '.yaml')) and any(keyword in file.lower() for keyword in ['lang', 'translation', 'locale', 'i18n']):
-                translation_files['yaml_translations'].append(file_path)
-            elif file.endswith('.properties'):
-                translation_files['properties_files'].append(file_path)
+            match = _TRANSLATION_FILE_RE.search(file)
+            if match:
+                bucket = _TRANSLATION_BUCKETS[match.group(match.lastindex)]
+                translation_files[bucket].append(os.path.join(root, file))
     
     return translation_files
 
 def detect_languages_in_content(content: str) -> Set[str]:
     """Detect potential languages in text content - English and Indic languages only"""
-    # Language detection focused on English and Indic languages
-    language_indicators = {
-        'english': ['en', 'english', 'hello', 'thank you', 'please', 'welcome', 'goodbye'],
-        'hindi': ['hi', 'हिंदी', 'नमस्ते', 'धन्यवाद', 'कृपया', 'स्वागत', 'अलविदा'],
-        'bengali': ['bn', 'বাংলা', 'নমস্কার', 'ধন্যবাদ', 'দয়া করে', 'স্বাগতম'],
-        'tamil': ['ta', 'தமிழ்', 'வணக்கம்', 'நன்றி', 'தயவுசெய்து', 'வரவேற்கிறோம்'],
-        'telugu': ['te', 'తెలుగు', 'నమస్కారం', 'ధన్యవాదాలు', 'దయచేసి', 'స్వాగతం'],
-        'marathi': ['mr', 'मराठी', 'नमस्कार', 'धन्यवाद', 'कृपया', 'स्वागत'],
-        'gujarati': ['gu', 'ગુજરાતી', 'નમસ્તે', 'આભાર', 'કૃપા કરીને', 'સ્વાગત'],
-        'kannada': ['kn', 'ಕನ್ನಡ', 'ನಮಸ್ತೆ', 'ಧನ್ಯವಾದಗಳು', 'ದಯವಿಟ್ಟು', 'ಸ್ವಾಗತ'],
-        'malayalam': ['ml', 'മലയാളം', 'നമസ്തേ', 'നന്ദി', 'ദയവായി', 'സ്വാഗതം'],
-        'punjabi': ['pa', 'ਪੰਜਾਬੀ', 'ਸਤ ਸ੍ਰੀ ਅਕਾਲ', 'ਧੰਨਵਾਦ', 'ਕਿਰਪਾ ਕਰਕੇ'],
-        'oriya': ['or', 'ଓଡ଼ିଆ', 'ନମସ୍କାର', 'ଧନ୍ୟବାଦ', 'ଦୟାକରି', 'ସ୍ୱାଗତ'],
-        'assamese': ['as', 'অসমীয়া', 'নমস্কাৰ', 'ধন্যবাদ', 'অনুগ্ৰহ কৰি'],
-        'urdu': ['ur', 'اردو', 'آداب', 'شکریہ', 'براہ کرم', 'خوش آمدید'],
-        'sanskrit': ['sa', 'संस्कृत', 'नमस्ते', 'धन्यवाद', 'कृपया'],
-        'kashmiri': ['ks', 'कॉशुर', 'नमस्कार', 'शुक्रिया', 'मेहरबानी'],
-        'nepali': ['ne', 'नेपाली', 'नमस्ते', 'धन्यवाद', 'कृपया', 'स्वागत'],
-        'sinhala': ['si', 'සිංහල', 'ආයුබෝවන්', 'ස්තූතියි', 'කරුණාකර']
+    detected_languages = {
+        lang for lang, pattern in _ASCII_INDICATOR_RES.items() if pattern.search(content)
     }
     
-    detected_languages = set()
-    content_lower = content.lower()
+    if ahocorasick is not None:
+        for _, languages in _UNICODE_INDICATOR_AUTOMATON.iter(content):
+            detected_languages.update(languages)
+        return detected_languages
     
-    for lang, indicators in language_indicators.items():
-        if any(indicator in content_lower for indicator in indicators):
+    for lang, indicators in _UNICODE_INDICATORS.items():
+        if lang not in detected_languages and any(indicator in content for indicator in indicators):
             detected_languages.add(lang)
     
     return detected_languages
 
 def analyze_requirements_file(directory: str) -> Dict:
     """Analyze requirements files for i18n-related packages"""
-    i18n_packages = [
-        'streamlit-i18n', 'babel', 'gettext', 'python-gettext',
-        'flask-babel', 'django-rosetta', 'polib', 'translate'
-    ]
-    
     found_packages = []
     requirements_files = []
     
@@ -251,10 +409,8 @@ def analyze_requirements_file(directory: str) -> Dict:
             requirements_files.append(req_file)
             try:
                 with open(req_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    for package in i18n_packages:
-                        if package.lower() in content.lower():
-                            found_packages.append(package)
+                    found = {match.lower() for match in _I18N_PACKAGE_RE.findall(f.read())}
+                found_packages.extend(package for package in _I18N_PACKAGES if package in found)
             except Exception:
                 continue
     
@@ -263,8 +419,28 @@ def analyze_requirements_file(directory: str) -> Dict:
         'i18n_packages': found_packages
     }
 
-def generate_multilingual_report(directory: str) -> Dict:
-    """Generate comprehensive multilingual analysis report"""
+def _relative_path(path: str, root_prefix: str) -> str:
+    """Strip root_prefix (the scan root plus a trailing separator) from path"""
+    return path[len(root_prefix):] if path.startswith(root_prefix) else path
+
+def _analyze_streamlit_file(file_path: str, full_scan: bool = False, languages_settled: Optional[threading.Event] = None) -> Optional[Tuple[str, Dict, Set[str]]]:
+    """Read, pattern-scan and language-scan one file; None if it is not a Streamlit file"""
+    content = _read_streamlit_source(file_path, full_scan)
+    if content is None:
+        return None
+    patterns = analyze_i18n_patterns(file_path, content)
+    if languages_settled is not None and languages_settled.is_set():
+        return file_path, patterns, set()
+    return file_path, patterns, detect_languages_in_content(content)
+
+def generate_multilingual_report(directory: str, scoring_only: bool = False, full_scan: bool = False) -> Dict:
+    """Generate comprehensive multilingual analysis report
+    
+    Streamlit files are analyzed up to MAX_SCAN_BYTES each unless full_scan
+    is set. With scoring_only, language detection stops once two languages
+    are found, since the score only checks for more than one;
+    detected_languages may then be incomplete.
+    """
     report = {
         'is_multilingual': False,
         'confidence_score': 0,
@@ -276,34 +452,39 @@ def generate_multilingual_report(directory: str) -> Dict:
         'recommendations': []
     }
     
-    # Find Streamlit files
-    streamlit_files = find_streamlit_files(directory)
-    report['streamlit_files'] = [str(f.relative_to(directory)) for f in streamlit_files]
+    # Discovered paths all start with the scan root, so report paths are
+    # sliced off that prefix rather than rebuilt through relpath
+    root_prefix = os.path.join(os.fspath(directory), '')
     
-    # Analyze each Streamlit file for i18n patterns
+    # Find Streamlit files and analyze each for i18n patterns, overlapping
+    # file reads with regex work across a thread pool
+    streamlit_files = []
     all_patterns = {}
     all_languages = set()
     
-    for file_path in streamlit_files:
-        patterns = analyze_i18n_patterns(file_path)
-        if patterns:
-            all_patterns[str(file_path.relative_to(directory))] = patterns
-        
-        # Check for languages in content
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                languages = detect_languages_in_content(content)
-                all_languages.update(languages)
-        except Exception:
-            continue
+    languages_settled = threading.Event() if scoring_only else None
+    analyze = partial(_analyze_streamlit_file, full_scan=full_scan, languages_settled=languages_settled)
+    
+    with ThreadPoolExecutor(max_workers=_ANALYSIS_WORKERS) as executor:
+        for result in executor.map(analyze, _scan_python_files(directory, full_scan)):
+            if result is None:
+                continue
+            file_path, patterns, languages = result
+            rel_path = _relative_path(file_path, root_prefix)
+            streamlit_files.append(rel_path)
+            if patterns:
+                all_patterns[rel_path] = patterns
+            all_languages.update(languages)
+            if languages_settled is not None and len(all_languages) >= 2:
+                languages_settled.set()
     
+    report['streamlit_files'] = streamlit_files
     report['i18n_patterns'] = all_patterns
     report['detected_languages'] = all_languages
     
     # Find translation files
     translation_files = find_translation_files(directory)
-    report['translation_files'] = {k: [str(Path(f).relative_to(directory)) for f in v] 
+    report['translation_files'] = {k: [_relative_path(f, root_prefix) for f in v] 
                                   for k, v in translation_files.items()}
     
     # Analyze requirements
@@ -311,16 +492,13 @@ def generate_multilingual_report(directory: str) -> Dict:
     report['requirements_analysis'] = requirements_analysis
     
     # Calculate confidence score and determine if multilingual
-    score = 0
-    
-    if all_patterns:
-        score += 40  # Strong indicator
-    if any(translation_files.values()):
-        score += 30  # Translation files present
-    if requirements_analysis['i18n_packages']:
-        score += 20  # I18n packages in requirements
-    if len(all_languages) > 1:
-        score += 10  # Multiple languages detected
+    has_translation_files = next((True for files in translation_files.values() if files), False)
+    score = sum(weight for weight, present in (
+        (40, bool(all_patterns)),                            # Strong indicator
+        (30, has_translation_files),                         # Translation files present
+        (20, bool(requirements_analysis['i18n_packages'])),  # I18n packages in requirements
+        (10, len(all_languages) > 1)                         # Multiple languages detected
+    ) if present)
     
     report['confidence_score'] = min(score, 100)
     report['is_multilingual'] = score >= 30
@@ -335,7 +513,7 @@ def generate_multilingual_report(directory: str) -> Dict:
     else:
         if not requirements_analysis['i18n_packages']:
             recommendations.append("Document your i18n dependencies in requirements.txt")
-        if not any(translation_files.values()):
+        if not has_translation_files:
             recommendations.append("Consider using standard translation file formats (.po, .json) for Indic languages")
         recommendations.append("Ensure proper Unicode support for Indic scripts in your application")
         recommendations.append("Test your application with different Indic language inputs")
@@ -344,6 +522,56 @@ def generate_multilingual_report(directory: str) -> Dict:
     
     return report
 
+def _remote_revision(repo_url: str) -> str:
+    """Identify the repository's current revision, or '' if it cannot be determined
+    
+    Tries the HEAD commit SHA from git ls-remote, then the project's
+    last_activity_at from the GitLab API.
+    """
+    git_url = repo_url if repo_url.endswith('.git') else repo_url + '.git'
+    try:
+        result = subprocess.run(
+            ['git', 'ls-remote', git_url, 'HEAD'],
+            capture_output=True,
+            text=True,
+            timeout=15
+        )
+        if result.returncode == 0 and result.stdout:
+            return result.stdout.split()[0]
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        pass
+    
+    try:
+        url = urlsplit(repo_url)
+        project_path = url.path.strip('/')
+        if project_path.endswith('.git'):
+            project_path = project_path[:-4]
+        project_path = quote(project_path, safe='')
+        response = requests.get(f"{url.scheme}://{url.netloc}/api/v4/projects/{project_path}", timeout=5)
+        if response.status_code == 200:
+            return response.json().get('last_activity_at', '')
+    except (requests.RequestException, ValueError):
+        pass
+    
+    return ''
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _analyze_url(repo_url: str, revision: str, scoring_only: bool = False, full_scan: bool = False) -> Dict:
+    """Download and analyze a repository, returning a JSON-serializable report
+    
+    Results are cached per URL, revision and scan options; revision only keys
+    the cache so a new push triggers a fresh analysis. Download failures raise
+    RuntimeError so that they are not cached.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        repo_dir = clone_gitlab_repo(repo_url, temp_dir)
+        if not repo_dir:
+            raise RuntimeError(f"Failed to download repository: {repo_url}")
+        report = generate_multilingual_report(repo_dir, scoring_only=scoring_only, full_scan=full_scan)
+    
+    report['detected_languages'] = sorted(report['detected_languages'])
+    return report
+
 # Streamlit UI
 def main():
     st.title("🌍 Streamlit Multilingual Checker - English & Indic Languages")
@@ -354,6 +582,17 @@ def main():
         st.header("Configuration")
         st.info("Enter your Git repository URL to analyze its multilingual capabilities for English and Indic languages")
         
+        quick_scoring = st.checkbox(
+            "Quick scoring",
+            value=False,
+            help="Stop language detection once two languages are found. The score is unaffected, but the JSON report may list fewer languages."
+        )
+        full_scan = st.checkbox(
+            "Full scan",
+            value=False,
+            help="Analyze entire files instead of only the first 64 KB of each. Slower on repositories with large generated files."
+        )
+        
         # Language scope information
         st.markdown("### Supported Language Detection")
         st.markdown("""
@@ -393,89 +632,93 @@ def main():
     if repo_url and repo_url.startswith(('http://', 'https://')):
         if st.button("Analyze Repository", type="primary"):
             with st.spinner("Downloading repository and analyzing..."):
-                # Create temporary directory
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    # Clone repository
-                    st.info("📥 Downloading repository... This may take a moment.")
-                    if clone_gitlab_repo(repo_url, temp_dir):
-                        st.success("✅ Repository downloaded successfully!")
-                        
-                        # Generate report
-                        st.info("🔍 Analyzing files for multilingual patterns...")
-                        report = generate_multilingual_report(temp_dir)
-                        
-                        # Display results
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.metric(
-                                "Multilingual Status",
-                                "✅ Yes" if report['is_multilingual'] else "❌ No"
-                            )
-                        
-                        with col2:
-                            st.metric(
-                                "Streamlit Files Found",
-                                len(report['streamlit_files'])
-                            )
-                        
-                        # Detailed Analysis
-                        st.header("📊 Detailed Analysis")
-                        
-                        # Translation Files
-                        translation_found = any(report['translation_files'].values())
-                        if translation_found:
-                            with st.expander("📄 Translation Files"):
-                                for file_type, files in report['translation_files'].items():
-                                    if files:
-                                        st.write(f"{file_type.replace('_', ' ').title()}:")
-                                        for file in files:
-                                            st.code(file, language='text')
-                        
-                        # Requirements Analysis
-                        if report['requirements_analysis']['i18n_packages']:
-                            with st.expander("📦 I18n Packages in Requirements"):
-                                for package in report['requirements_analysis']['i18n_packages']:
-                                    st.code(package)
-                        
-                        # Recommendations
-                        if report['recommendations']:
-                            st.header("💡 Recommendations")
-                            for i, rec in enumerate(report['recommendations'], 1):
-                                st.write(f"{i}. {rec}")
-                        
-                        # Summary
-                        st.header("📋 Summary")
-                        
-                        if report['is_multilingual']:
-                            st.success("✅ This Streamlit application appears to have multilingual support for English and/or Indic languages!")
-                            st.balloons()
-                        else:
-                            st.warning("⚠ This Streamlit application does not appear to have multilingual support for English and Indic languages.")
-                        
-                        # Export report
-                        if st.button("📥 Download Report as JSON"):
-                            # Convert sets to lists for JSON serialization
-                            export_report = report.copy()
-                            export_report['detected_languages'] = list(report['detected_languages'])
-                            
-                            st.download_button(
-                                label="Download JSON Report",
-                                data=json.dumps(export_report, indent=2),
-                                file_name=f"multilingual_report_{repo_url.split('/')[-1]}.json",
-                                mime="application/json"
-                            )
+                st.info("📥 Downloading and analyzing repository... This may take a moment.")
+                try:
+                    report = _analyze_url(
+                        repo_url,
+                        _remote_revision(repo_url),
+                        scoring_only=quick_scoring,
+                        full_scan=full_scan
+                    )
+                except RuntimeError:
+                    report = None
+                
+                if report:
+                    st.success("✅ Repository downloaded and analyzed successfully!")
                     
+                    # Display results
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.metric(
+                            "Multilingual Status",
+                            "✅ Yes" if report['is_multilingual'] else "❌ No"
+                        )
+                    
+                    with col2:
+                        st.metric(
+                            "Streamlit Files Found",
+                            len(report['streamlit_files'])
+                        )
+                    
+                    # Detailed Analysis
+                    st.header("📊 Detailed Analysis")
+                    
+                    # Translation Files
+                    translation_found = any(report['translation_files'].values())
+                    if translation_found:
+                        with st.expander("📄 Translation Files"):
+                            for file_type, files in report['translation_files'].items():
+                                if files:
+                                    st.write(f"{file_type.replace('_', ' ').title()}:")
+                                    for file in files:
+                                        st.code(file, language='text')
+                    
+                    # Requirements Analysis
+                    if report['requirements_analysis']['i18n_packages']:
+                        with st.expander("📦 I18n Packages in Requirements"):
+                            for package in report['requirements_analysis']['i18n_packages']:
+                                st.code(package)
+                    
+                    # Recommendations
+                    if report['recommendations']:
+                        st.header("💡 Recommendations")
+                        for i, rec in enumerate(report['recommendations'], 1):
+                            st.write(f"{i}. {rec}")
+                    
+                    # Summary
+                    st.header("📋 Summary")
+                    
+                    if report['is_multilingual']:
+                        st.success("✅ This Streamlit application appears to have multilingual support for English and/or Indic languages!")
+                        st.balloons()
                     else:
-                        st.error("❌ Failed to download repository. Please check:")
-                        st.markdown("""
-                        - **URL is correct** and publicly accessible
-                        - **Repository exists** and is not private
-                        - **Network connection** is stable
-                        - Try copying the exact URL from your browser
-                        """)
+                        st.warning("⚠ This Streamlit application does not appear to have multilingual support for English and Indic languages.")
+                    
+                    # Export report
+                    if st.button("📥 Download Report as JSON"):
+                        if orjson is not None:
+                            report_json = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+                        else:
+                            report_json = json.dumps(report, indent=2)
                         
-                        st.info("💡 **Tip:** Make sure the GitLab repository is public or use a repository you have access to.")
+                        st.download_button(
+                            label="Download JSON Report",
+                            data=report_json,
+                            file_name=f"multilingual_report_{repo_url.split('/')[-1]}.json",
+                            mime="application/json"
+                        )
+                
+                else:
+                    st.error("❌ Failed to download repository. Please check:")
+                    st.markdown("""
+                    - **URL is correct** and publicly accessible
+                    - **Repository exists** and is not private
+                    - **Network connection** is stable
+                    - Try copying the exact URL from your browser
+                    """)
+                    
+                    st.info("💡 **Tip:** Make sure the GitLab repository is public or use a repository you have access to.")
     
     # Footer
     st.markdown("---")